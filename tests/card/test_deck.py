@@ -50,3 +50,11 @@ def test_shuffle(deck):
     deck.shuffle()
     new_cards = list(deck.cards)
     assert cards != new_cards, "Expected decks to not equal after shuffled"
+
+
+def test_stacked_draw(deck):
+    """Setting the cards of a deck draws them in the given order."""
+    cards = list(deck.cards)[:5]
+    deck.cards = list(cards)
+    assert deck.draw(num=2) == cards[:2], "Expected stacked cards to be drawn in order"
+    assert deck.cards == cards[2:], "Expected the rest of the stack to remain in order"
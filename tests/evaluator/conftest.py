@@ -14,6 +14,8 @@ from texasholdem.card.card import Card
 
 MAX_HAND_RANK = 7462
 FUZZ_COMPARE_WITH_BOARD = 10000
+FUZZ_SHARED_BOARD = 1000
+EVALUATE_BATCH_RUNS = 100
 GETTER_CONVENIENCE_RUNS = 100
 ALL_SUITS = tuple(Card.CHAR_SUIT_TO_INT_SUIT.keys())
 
@@ -4,6 +4,8 @@ Includes:
     - Fuzz testing for
         - 5 v 5 unrelated hands
         - 2 cards with board length 3, 4, 5
+        - many hands sharing one board against every five card hand
+        - evaluate_batch against evaluate
         - evaluator module convenience methods
             - get_rank_class
             - rank_to_string
@@ -15,11 +17,14 @@ import random
 
 import pytest
 
+from texasholdem.card.deck import Deck
 from texasholdem.evaluator import evaluator
 from tests.evaluator.conftest import (
     generate_sample_hand,
     less_hands_same_class,
     FUZZ_COMPARE_WITH_BOARD,
+    FUZZ_SHARED_BOARD,
+    EVALUATE_BATCH_RUNS,
     GETTER_CONVENIENCE_RUNS,
     MAX_HAND_RANK,
 )
@@ -74,6 +79,47 @@ def test_fuzz_compare_with_board(board_len):
         assert score1 == score2, f"Expected {hand1} and {hand2} to have the same score"
 
 
+@pytest.mark.repeat(FUZZ_SHARED_BOARD)
+@pytest.mark.parametrize("board_len", (3, 4, 5))
+def test_fuzz_shared_board(board_len):
+    """
+    Tests if evaluate_batch returns the rank of the best five card hand for several
+    players in a row that share the same board.
+    """
+    deck = Deck()
+    board = deck.draw(num=board_len)
+    hands = [deck.draw(num=2) for _ in range(4)]
+
+    ranks = evaluator.evaluate_batch(hands, [board] * len(hands))
+    for hand, rank in zip(hands, ranks):
+        assert rank == min(
+            evaluator.evaluate([], list(five))
+            for five in itertools.combinations(hand + board, 5)
+        ), f"Expected the best five card hand out of {hand} and {board}"
+
+
+@pytest.mark.repeat(EVALUATE_BATCH_RUNS)
+def test_evaluate_batch():
+    """
+    Tests if evaluate_batch returns the same ranks as evaluate for hands
+    with shared and with different boards.
+    """
+    hands, boards = [], []
+    for board_len in (0, 3, 4, 5):
+        deck = Deck()
+        board = deck.draw(num=board_len)
+        for _ in range(3):
+            hands.append(deck.draw(num=5 if board_len == 0 else 2))
+            boards.append(board)
+
+    assert evaluator.evaluate_batch(hands, boards) == [
+        evaluator.evaluate(hand, board) for hand, board in zip(hands, boards)
+    ]
+
+    with pytest.raises(ValueError):
+        evaluator.evaluate_batch(hands, boards[:-1])
+
+
 @pytest.mark.repeat(GETTER_CONVENIENCE_RUNS)
 def test_get_rank_class():
     """
@@ -6,6 +6,9 @@ Includes:
     - SKIP statuses for players with 0 chips
     - 2 player prehand check edge case
     - Blind players having less than a blind = ALL_IN
+    - Pots split off by an all-in blind are collected after PREFLOP
+    - Setting a player state directly updates the game
+    - A pot built without a size grows as players post
     - Game cannot continue after trying to run start_hand()
     - Basic betting round status checks for all streets
     - Tests settle status checks
@@ -22,7 +25,7 @@ from typing import Iterable
 
 import pytest
 
-from texasholdem.game.game import TexasHoldEm
+from texasholdem.game.game import TexasHoldEm, Pot
 from texasholdem.game.hand_phase import HandPhase
 from texasholdem.game.player_state import PlayerState
 from texasholdem.evaluator.evaluator import evaluate
@@ -124,6 +127,62 @@ def test_blind_all_in_prehand(texas_game):
     assert texas.players[texas.bb_loc].state == PlayerState.ALL_IN
 
 
+def test_blind_all_in_bets_collected(texas_game, call_agent):
+    """
+    If a blind goes all-in for less than the big blind, the pot split off
+    during PREHAND is collected with the rest at the end of PREFLOP.
+
+    """
+    texas = texas_game(max_players=3)
+
+    # the button moves one seat, so the current button ends up as the big blind
+    texas.players[texas.btn_loc].chips = 1
+    texas.start_hand()
+    assert texas.players[texas.bb_loc].state == PlayerState.ALL_IN
+
+    while texas.hand_phase == HandPhase.PREFLOP:
+        texas.take_action(*call_agent(texas))
+
+    assert texas.hand_phase == HandPhase.FLOP
+    assert all(
+        texas.player_bet_amount(i) == 0 for i in range(texas.max_players)
+    ), "Expected no bets carried over from the preflop round"
+
+
+def test_set_player_state(texas_game):
+    """
+    Setting the state of a player directly is seen by the game iterators.
+
+    """
+    texas = texas_game()
+    texas.start_hand()
+
+    player_id = texas.current_player
+    texas.players[player_id].state = PlayerState.OUT
+
+    assert texas.players[player_id].state == PlayerState.OUT
+    assert player_id not in list(texas.active_iter())
+    assert player_id not in list(texas.in_pot_iter())
+
+
+def test_pot_without_size():
+    """
+    A Pot constructed without max_players grows its player amounts as needed.
+
+    """
+    pot = Pot()
+    assert pot.get_player_amount(3) == 0
+
+    pot.player_post(3, 10)
+    pot.player_post(1, 20)
+
+    assert list(pot.players_in_pot()) == [3, 1]
+    assert pot.get_player_amount(3) == 10
+    assert pot.chips_to_call(3) == 10
+    assert pot.chips_to_call(7) == 20
+    assert pot.get_total_amount() == 30
+
+
 def test_game_stop_prehand(texas_game):
     """
     Trying to run a hand when a hand cannot be run won't get passed
@@ -137,7 +137,10 @@ class Card(int):
             str: The human-readable string representing this card.
 
         """
-        return Card.STR_RANKS[self.rank] + Card.INT_SUIT_TO_CHAR_SUIT[self.suit]
+        string = _CARD_STRINGS.get(self)
+        if string is None:
+            string = Card.STR_RANKS[self.rank] + Card.INT_SUIT_TO_CHAR_SUIT[self.suit]
+        return string
 
     def __repr__(self) -> str:
         return f'Card("{str(self)}")'
@@ -248,7 +251,8 @@ def card_strings_to_int(card_strs: Iterable[str]) -> List[Card]:
     """
     bhand = []
     for card_str in card_strs:
-        bhand.append(Card(card_str))
+        card = _CARDS.get(card_str)
+        bhand.append(Card(card_str) if card is None else card)
     return bhand
 
 
@@ -310,3 +314,14 @@ def card_list_to_pretty_str(cards: List[Card]) -> str:
 
     """
     return " ".join(card.pretty_string for card in cards)
+
+
+# the string of each of the 52 cards, cards are printed for every line of a history
+_CARD_STRINGS = {
+    Card(rank + suit): rank + suit
+    for rank in Card.STR_RANKS
+    for suit in Card.CHAR_SUIT_TO_INT_SUIT
+}
+
+# the reverse, card strings are parsed for every line of an imported history
+_CARDS = {string: card for card, string in _CARD_STRINGS.items()}
@@ -12,20 +12,68 @@ class Deck:
     deck with the list of unique card integers. Each object instantiated simply
     makes a copy of this object and shuffles it.
 
+    The shuffle is lazy: cards are only put in their final random position
+    when they are drawn or when :attr:`cards` is read, so a hand that only
+    deals a few cards does not pay for shuffling all 52. Drawing moves a cursor
+    over the cards instead of rebuilding the list of remaining cards.
+
     """
 
     _FULL_DECK: List[Card] = []
 
     def __init__(self):
-        self.cards = Deck._get_full_deck()
-        self.shuffle()
+        self._cards = Deck._get_full_deck()
+
+        # index of the next card to draw, the cards before it have been drawn
+        self._top = 0
+
+        # the first _num_shuffled cards are in their final order
+        self._num_shuffled = 0
+
+    @property
+    def cards(self) -> List[Card]:
+        """
+        The cards remaining in the deck in the order they will be drawn.
+        Setting this stacks the deck, i.e. the cards will be drawn in the given order.
+
+        """
+        if self._top:
+            self._cards = self._cards[self._top :]
+            self._num_shuffled -= self._top
+            self._top = 0
+
+        self._shuffle_to(len(self._cards))
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._cards = cards
+        self._top = 0
+        self._num_shuffled = len(cards)
 
     def shuffle(self) -> None:
         """
         Shuffles the remaining cards in the deck.
 
         """
-        random.shuffle(self.cards)
+        self._num_shuffled = self._top
+
+    def _shuffle_to(self, num: int) -> None:
+        """
+        Fisher-Yates shuffle from the top of the deck, stopping once the first
+        num cards are in their final position.
+
+        Args:
+            num (int): How many cards from the top of the deck should be shuffled.
+
+        """
+        cards = self._cards
+        size = len(cards)
+        end = min(self._top + num, size)
+        for i in range(self._num_shuffled, end):
+            j = i + int(random.random() * (size - i))
+            cards[i], cards[j] = cards[j], cards[i]
+        self._num_shuffled = max(self._num_shuffled, end)
 
     def draw(self, num=1) -> List[Card]:
         """
@@ -39,14 +87,15 @@ class Deck:
             ValueError: If the deck size is less than the given n.
 
         """
-        if len(self.cards) < num:
+        top = self._top
+        if len(self._cards) - top < num:
             raise ValueError(
-                f"Cannot draw {num} cards from deck of size {len(self.cards)}"
+                f"Cannot draw {num} cards from deck of size {len(self._cards) - top}"
             )
 
-        cards = self.cards[:num]
-        self.cards = self.cards[num:]
-        return cards
+        self._shuffle_to(num)
+        self._top = top + num
+        return self._cards[top : top + num]
 
     def __str__(self) -> str:
         return card.card_list_to_pretty_str(self.cards)
@@ -2,6 +2,7 @@
 
 from texasholdem.evaluator.evaluator import (
     evaluate,
+    evaluate_batch,
     get_rank_class,
     rank_to_string,
     get_five_card_rank_percentage,
@@ -4,35 +4,114 @@ Evaluates hand strengths with optimizations in terms of speed and memory usage.
 """
 
 import itertools
-from typing import List
+from typing import Callable, List, Sequence, Tuple
 
-from texasholdem.card import card
 from texasholdem.card.card import Card
 from texasholdem.evaluator.lookup_table import LOOKUP_TABLE
 
+_FLUSH_LOOKUP = LOOKUP_TABLE.flush_lookup
+_UNSUITED_LOOKUP = LOOKUP_TABLE.unsuited_lookup
 
-def _five(cards: List[Card]) -> int:
+
+def _five(cards: Sequence[int]) -> int:
     """
     Performs an evaluation given card in integer form, mapping them to
     a rank in the range [1, 7462], with lower ranks being more powerful.
 
-    Variant of Cactus Kev's 5 card evaluator.
+    Variant of Cactus Kev's 5 card evaluator. Only reads the bits of the cards,
+    so plain ints in the :class:`~texasholdem.card.card.Card` format work as well.
 
     Args:
-        cards (List[Card]): A list of 5 card ints.
+        cards (Sequence[int]): A sequence of 5 card ints.
     Returns:
         int: The rank of the hand.
 
     """
+    card0, card1, card2, card3, card4 = cards
+
+    # the ranks in a flush are all different, so the product of the card primes
+    # is the same as the prime product of the rank bits
+    prime = (
+        (card0 & 0x3F)
+        * (card1 & 0x3F)
+        * (card2 & 0x3F)
+        * (card3 & 0x3F)
+        * (card4 & 0x3F)
+    )
+
     # if flush
-    if cards[0] & cards[1] & cards[2] & cards[3] & cards[4] & 0xF000:
-        hand_or = (cards[0] | cards[1] | cards[2] | cards[3] | cards[4]) >> 16
-        prime = card.prime_product_from_rankbits(hand_or)
-        return LOOKUP_TABLE.flush_lookup[prime]
+    if card0 & card1 & card2 & card3 & card4 & 0xF000:
+        return _FLUSH_LOOKUP[prime]
 
     # otherwise
-    prime = card.prime_product_from_hand(cards)
-    return LOOKUP_TABLE.unsuited_lookup[prime]
+    return _UNSUITED_LOOKUP[prime]
+
+
+def _board_ranker(board: Sequence[int]) -> Callable[[Sequence[int]], int]:
+    """
+    Precomputes the prime products and shared suit bits of every three and four
+    card subset of the board, so that evaluating two hole cards against it only
+    needs a multiplication and a lookup per five card hand.
+
+    Args:
+        board (Sequence[int]): A sequence of 3, 4, or 5 card ints.
+    Returns:
+        Callable[[Sequence[int]], int]: Maps two hole cards to the rank of the best hand.
+
+    """
+    # board only hand, any real hand beats the placeholder rank
+    board_rank = _five(board) if len(board) == 5 else LOOKUP_TABLE.MAX_HIGH_CARD + 1
+
+    def parts(num: int) -> List[Tuple[int, int]]:
+        subsets = []
+        for subset in itertools.combinations(board, num):
+            prime, suits = 1, 0xF000
+            for card in subset:
+                prime *= card & 0x3F
+                suits &= card
+            subsets.append((prime, suits))
+        return subsets
+
+    # hands with one hole card and four board cards
+    quads = parts(4)
+
+    # hands with both hole cards and three board cards
+    triples = parts(3)
+
+    def rank(cards: Sequence[int]) -> int:
+        # an inline compare is cheaper than a min() call per lookup in this hot loop
+        # pylint: disable=consider-using-min-builtin
+        card0, card1 = cards
+        prime0, prime1 = card0 & 0x3F, card1 & 0x3F
+        best = board_rank
+
+        for prime, suits in quads:
+            if suits & card0:
+                hand_rank = _FLUSH_LOOKUP[prime * prime0]
+            else:
+                hand_rank = _UNSUITED_LOOKUP[prime * prime0]
+            if hand_rank < best:
+                best = hand_rank
+
+            if suits & card1:
+                hand_rank = _FLUSH_LOOKUP[prime * prime1]
+            else:
+                hand_rank = _UNSUITED_LOOKUP[prime * prime1]
+            if hand_rank < best:
+                best = hand_rank
+
+        both_prime, both_suits = prime0 * prime1, card0 & card1
+        for prime, suits in triples:
+            if suits & both_suits:
+                hand_rank = _FLUSH_LOOKUP[prime * both_prime]
+            else:
+                hand_rank = _UNSUITED_LOOKUP[prime * both_prime]
+            if hand_rank < best:
+                best = hand_rank
+
+        return best
+
+    return rank
 
 
 def evaluate(cards: List[Card], board: List[Card]) -> int:
@@ -49,7 +128,45 @@ def evaluate(cards: List[Card], board: List[Card]) -> int:
 
     """
     all_cards = cards + board
-    return min(_five(hand) for hand in itertools.combinations(all_cards, 5))
+    return min(map(_five, itertools.combinations(all_cards, 5)))
+
+
+def evaluate_batch(
+    hands: Sequence[List[Card]], boards: Sequence[List[Card]]
+) -> List[int]:
+    """
+    Evaluates many hands at once, the i-th hand against the i-th board. The work done on
+    a board is reused for the hands after it that share the same board, so keep hands
+    with the same board next to each other (i.e. all players at a showdown or many
+    hands against the same runout).
+
+    Args:
+        hands (Sequence[List[Card]]): Lists of cards that players hold.
+        boards (Sequence[List[Card]]): For each hand, a list of length 3, 4, or 5 of cards.
+    Returns:
+        List[int]: The rank of each hand as given by :func:`evaluate`.
+    Raises:
+        ValueError: If the number of hands and boards differ.
+
+    """
+    if len(hands) != len(boards):
+        raise ValueError(
+            f"Expected as many boards as hands, got {len(boards)} boards "
+            f"for {len(hands)} hands"
+        )
+
+    ranks = []
+    board_key, ranker = (), None
+    for cards, board in zip(hands, boards):
+        if len(cards) != 2 or not 3 <= len(board) <= 5:
+            ranks.append(evaluate(cards, board))
+            continue
+
+        if board_key != tuple(board):
+            board_key, ranker = tuple(board), _board_ranker(board)
+        ranks.append(ranker(cards))
+
+    return ranks
 
 
 def get_rank_class(hand_rank: int) -> int:
@@ -47,19 +47,41 @@ class Player:
     Attributes:
         player_id (int): The player id
         chips (int): The number of chips the player has behind them
-        state (PlayerState): The player state
+        state (PlayerState): The player state, setting it updates the game the
+            player belongs to
         last_pot (int): The pot id of the last pot the player is eligible for.
 
     """
 
-    def __init__(self, player_id, chips):
+    __slots__ = ("player_id", "chips", "_state", "last_pot", "_game")
+
+    def __init__(self, player_id, chips, game: Optional[TexasHoldEm] = None):
         self.player_id = player_id
         self.chips = chips
-        self.state = PlayerState.IN
+        self._state = PlayerState.IN
 
         # invariant: last_pot is the newest pot that player is eligible for
         self.last_pot = 0
 
+        # the game keeps its own record of player states, see TexasHoldEm._set_player_state
+        self._game = game
+
+    @property
+    def state(self) -> PlayerState:
+        """
+        The player state
+
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: PlayerState):
+        # pylint: disable=protected-access
+        if self._game is None:
+            self._state = state
+        else:
+            self._game._set_player_state(self.player_id, state)
+
 
 class Pot:
     """
@@ -68,18 +90,26 @@ class Pot:
 
     At the end of a betting round, the bets are consolidated and reset.
 
+    Arguments:
+        max_players (int): The number of seats at the table, defaults to 0. The
+            player amounts grow as needed if a player with a larger id posts.
     Attributes:
         amount (int): The amount of chips in the pot NOT including the current betting round
         raised (int): The highest bet amount in the current betting round
-        player_amounts (Dict[int, int]): A map from player id to # chips each player has posted
-                                         this round
+        player_amounts (List[int]): The # chips each player has posted this round,
+                                    indexed by player id
 
     """
 
-    def __init__(self):
+    __slots__ = ("amount", "raised", "player_amounts", "_players")
+
+    def __init__(self, max_players: int = 0):
         self.amount = 0
         self.raised = 0
-        self.player_amounts = {}
+        self.player_amounts = [0] * max_players
+
+        # ids of the players with a stake in the pot in the order they first posted
+        self._players: List[int] = []
 
     def chips_to_call(self, player_id: int) -> int:
         """Returns the amount of chips to call for the given player.
@@ -92,7 +122,9 @@ class Pot:
               This is just :attr:`raised` if the player hasn't bet yet.
 
         """
-        return self.raised - self.player_amounts.get(player_id, 0)
+        if player_id >= len(self.player_amounts):
+            return self.raised
+        return self.raised - self.player_amounts[player_id]
 
     def player_post(self, player_id: int, amount: int):
         """
@@ -104,7 +136,13 @@ class Pot:
             amount (int): The amount to post into this pot
 
         """
-        self.player_amounts[player_id] = self.player_amounts.get(player_id, 0) + amount
+        if player_id not in self._players:
+            self._players.append(player_id)
+
+        if player_id >= len(self.player_amounts):
+            self.player_amounts.extend([0] * (player_id + 1 - len(self.player_amounts)))
+
+        self.player_amounts[player_id] += amount
 
         if self.player_amounts[player_id] > self.raised:
             self.raised = self.player_amounts[player_id]
@@ -117,7 +155,9 @@ class Pot:
             int: the amount the player has bet currently for this pot.
 
         """
-        return self.player_amounts.get(player_id, 0)
+        if player_id >= len(self.player_amounts):
+            return 0
+        return self.player_amounts[player_id]
 
     def players_in_pot(self) -> Iterator[int]:
         """
@@ -126,7 +166,7 @@ class Pot:
 
         """
 
-        return iter(self.player_amounts.keys())
+        return iter(self._players)
 
     def collect_bets(self):
         """
@@ -135,9 +175,8 @@ class Pot:
 
         """
         self.raised = 0
-        for player_id, player_amount in self.player_amounts.items():
-            self.amount += player_amount
-            self.player_amounts[player_id] = 0
+        self.amount += sum(self.player_amounts)
+        self.player_amounts = [0] * len(self.player_amounts)
 
     def remove_player(self, player_id: int):
         """
@@ -148,10 +187,12 @@ class Pot:
             player_id (int): The player id
 
         """
-        if player_id not in self.player_amounts:
+        if player_id not in self._players:
             return
 
-        self.amount += self.player_amounts.pop(player_id)
+        self._players.remove(player_id)
+        self.amount += self.player_amounts[player_id]
+        self.player_amounts[player_id] = 0
 
     def get_amount(self) -> int:
         """
@@ -169,7 +210,7 @@ class Pot:
 
         """
 
-        return sum(self.player_amounts.values()) + self.get_amount()
+        return sum(self.player_amounts) + self.get_amount()
 
     def split_pot(self, raised_level: int) -> Optional[Pot]:
         """
@@ -184,15 +225,16 @@ class Pot:
         if self.raised <= raised_level:
             return None
 
-        split_pot = Pot()
+        split_pot = Pot(len(self.player_amounts))
         self.raised = raised_level
 
-        for player_id in self.players_in_pot():
+        player_amounts = self.player_amounts
+        for player_id in self._players:
             # player currently in last pot, post overflow to the split pot
-            if self.get_player_amount(player_id) > self.raised:
-                overflow = self.get_player_amount(player_id) - self.raised
+            overflow = player_amounts[player_id] - raised_level
+            if overflow > 0:
                 split_pot.player_post(player_id, overflow)
-                self.player_amounts[player_id] -= overflow
+                player_amounts[player_id] = raised_level
 
         return split_pot
 
@@ -253,6 +295,37 @@ class TexasHoldEm:
 
     """
 
+    __slots__ = (
+        "buyin",
+        "big_blind",
+        "small_blind",
+        "max_players",
+        "players",
+        "_player_states",
+        "_seat_order",
+        "_player_bets",
+        "btn_loc",
+        "bb_loc",
+        "sb_loc",
+        "current_player",
+        "pots",
+        "_deck",
+        "board",
+        "hands",
+        "last_raise",
+        "raise_option",
+        "_in_mask",
+        "_to_call_mask",
+        "num_hands",
+        "hand_phase",
+        "game_state",
+        "_handstate_handler",
+        "_action_handler",
+        "hand_history",
+        "_action",
+        "_hand_gen",
+    )
+
     def __init__(self, buyin: int, big_blind: int, small_blind: int, max_players=9):
         self.buyin = buyin
         self.big_blind = big_blind
@@ -260,9 +333,19 @@ class TexasHoldEm:
         self.max_players = max_players
 
         self.players: List[Player] = list(
-            Player(i, self.buyin) for i in range(max_players)
+            Player(i, self.buyin, game=self) for i in range(max_players)
         )
 
+        # player state values by player id mirrored from self.players,
+        # see _set_player_state
+        self._player_states: List[int] = [player.state.value for player in self.players]
+
+        # player ids for two laps around the table, player_iter slices one lap out of this
+        self._seat_order = tuple(i % max_players for i in range(2 * max_players))
+
+        # chips each player has bet this round across all pots, see player_bet_amount
+        self._player_bets = [0] * max_players
+
         self.btn_loc = random.choice(self.players).player_id
         self.bb_loc = -1
         self.sb_loc = -1
@@ -275,6 +358,10 @@ class TexasHoldEm:
         self.last_raise = 0
         self.raise_option = True
 
+        # bit i is set if player i has state IN / TO_CALL, see _set_player_state
+        self._in_mask = 0
+        self._to_call_mask = 0
+
         self.num_hands = 0
         self.hand_phase = HandPhase.PREHAND
         self.game_state = GameState.RUNNING
@@ -290,6 +377,13 @@ class TexasHoldEm:
             HandPhase.SETTLE: self._settle,
         }
 
+        self._action_handler: Dict[ActionType, Callable[[Optional[int]], None]] = {
+            ActionType.CALL: self._call,
+            ActionType.CHECK: self._check,
+            ActionType.RAISE: self._raise,
+            ActionType.FOLD: self._fold,
+        }
+
         self.hand_history: Optional[History] = None
         self._action = None, None
         self._hand_gen = None
@@ -311,41 +405,49 @@ class TexasHoldEm:
             raise ValueError("Not time for prehand!")
 
         # set statuses for players
-        for player_id in self.player_iter(loc=0):
-            self.players[player_id].last_pot = 0
+        for player in self.players:
+            player.last_pot = 0
 
-            if self.players[player_id].chips == 0:
-                self.players[player_id].state = PlayerState.SKIP
+            if player.chips == 0:
+                self._set_player_state(player.player_id, PlayerState.SKIP)
             else:
-                self.players[player_id].state = PlayerState.TO_CALL
+                self._set_player_state(player.player_id, PlayerState.TO_CALL)
 
         active_players = list(self.in_pot_iter(self.btn_loc + 1))
+        num_active = len(active_players)
 
         # stop if only 1 player
-        if len(active_players) <= 1:
+        if num_active <= 1:
             self.game_state = GameState.STOPPED
             return
 
         # change btn loc (at least 2 players)
+        # active_players is already in seat order starting from the button,
+        # so the blinds and first actor are just offsets into it
         self.btn_loc = active_players[0]
         self.sb_loc = active_players[1]
+        bb_index = 2
 
         # heads up edge case => sb = btn
-        if len(active_players) == 2:
+        if num_active == 2:
             self.sb_loc = self.btn_loc
+            bb_index = 1
 
-        self.bb_loc = next(self.in_pot_iter(self.sb_loc + 1))
+        self.bb_loc = active_players[bb_index]
 
         # reset pots
-        self.pots = [Pot()]
+        self.pots = [Pot(self.max_players)]
+        self._player_bets = [0] * self.max_players
 
         # deal cards
         self._deck = Deck()
         self.hands = {}
         self.board = []
 
-        for player_id in self.in_pot_iter(self.btn_loc + 1):
-            self.hands[player_id] = self._deck.draw(num=2)
+        # one draw for all hole cards, dealt two at a time starting left of the button
+        hole_cards = self._deck.draw(num=2 * num_active)
+        for i, player_id in enumerate(active_players[1:] + active_players[:1]):
+            self.hands[player_id] = hole_cards[2 * i : 2 * i + 2]
 
         # reset history
         self._action = None, None
@@ -368,7 +470,7 @@ class TexasHoldEm:
         self.last_raise = 0
 
         # action to left of BB
-        self.current_player = next(self.in_pot_iter(loc=self.bb_loc + 1))
+        self.current_player = active_players[(bb_index + 1) % num_active]
         self.num_hands += 1
 
     def player_iter(
@@ -390,22 +492,33 @@ class TexasHoldEm:
         Returns:
             Iterator[int]: An iterator over all player ids.
 
+        """
+        match_values = [state.value for state in match_states]
+        filter_values = [state.value for state in filter_states]
+
+        states = self._player_states
+        for player_id in self._seats(loc, reverse):
+            state = states[player_id]
+            if state not in filter_values and state in match_values:
+                yield player_id
+
+    def _seats(self, loc: Optional[int], reverse: bool) -> Tuple[int, ...]:
+        """
+        Arguments:
+            loc (int, optional): The player_id to start at, default is :attr:`current_player`.
+            reverse (bool): In reverse play order
+        Returns:
+            Tuple[int, ...]: All player ids in play order starting at the given location.
+
         """
         if loc is None:
             loc = self.current_player
 
         loc = loc % self.max_players
 
-        start, stop, step = loc, loc + self.max_players, 1
         if reverse:
-            start, stop, step = stop, start, -step
-
-        for i in range(start, stop, step):
-            if (
-                self.players[i % self.max_players].state not in filter_states
-                and self.players[i % self.max_players].state in match_states
-            ):
-                yield i % self.max_players
+            return self._seat_order[loc + self.max_players : loc : -1]
+        return self._seat_order[loc : loc + self.max_players]
 
     def in_pot_iter(self, loc: int = None, reverse: bool = False) -> Iterator[int]:
         """
@@ -420,10 +533,13 @@ class TexasHoldEm:
             Iterator[int]: An iterator over players with a stake in the pot
 
         """
-        if loc is None:
-            loc = self.current_player
-        yield from self.player_iter(
-            loc=loc, reverse=reverse, filter_states=(PlayerState.OUT, PlayerState.SKIP)
+        # everyone from IN up has a stake in the pot, see PlayerState
+        in_value = PlayerState.IN.value
+        states = self._player_states
+        return (
+            player_id
+            for player_id in self._seats(loc, reverse)
+            if states[player_id] >= in_value
         )
 
     def active_iter(self, loc: int = None, reverse: bool = False) -> Iterator[int]:
@@ -440,10 +556,13 @@ class TexasHoldEm:
             Iterator[int]: An iterator over active players who can take an action.
 
         """
-        if loc is None:
-            loc = self.current_player
-        yield from self.player_iter(
-            loc=loc, reverse=reverse, match_states=(PlayerState.TO_CALL, PlayerState.IN)
+        # IN and TO_CALL are adjacent, see PlayerState
+        in_value, to_call_value = PlayerState.IN.value, PlayerState.TO_CALL.value
+        states = self._player_states
+        return (
+            player_id
+            for player_id in self._seats(loc, reverse)
+            if in_value <= states[player_id] <= to_call_value
         )
 
     def _split_pot(self, pot_id: int, raised_level: int):
@@ -456,7 +575,7 @@ class TexasHoldEm:
             raised_level (int): The chip count to cut off at
 
         """
-        pot = self._get_pot(pot_id)
+        pot = self.pots[pot_id]
         split_pot = pot.split_pot(raised_level)
 
         if not split_pot:
@@ -479,48 +598,97 @@ class TexasHoldEm:
             amount (int): The amount to post
 
         """
-        amount = min(self.players[player_id].chips, amount)
+        player = self.players[player_id]
+        amount = min(player.chips, amount)
         original_amount = amount
-        last_pot = self.players[player_id].last_pot
+        last_pot = player.last_pot
 
         # if a player posts, they are in the pot
-        if amount == self.players[player_id].chips:
-            self.players[player_id].state = PlayerState.ALL_IN
+        if amount == player.chips:
+            self._set_player_state(player_id, PlayerState.ALL_IN)
         else:
-            self.players[player_id].state = PlayerState.IN
+            self._set_player_state(player_id, PlayerState.IN)
 
         # call in previous pots
         for i in range(last_pot):
-            amount = amount - self._get_pot(i).chips_to_call(player_id)
-            self.pots[i].player_post(player_id, self.pots[i].chips_to_call(player_id))
+            prev_pot = self.pots[i]
+            pot_chips_to_call = prev_pot.chips_to_call(player_id)
+            if pot_chips_to_call:
+                amount = amount - pot_chips_to_call
+                prev_pot.player_post(player_id, pot_chips_to_call)
+
+        pot = self.pots[last_pot]
 
-        prev_raise_level = self.pots[last_pot].raised
-        self._get_pot(last_pot).player_post(player_id, amount)
+        prev_raise_level = pot.raised
+        pot.player_post(player_id, amount)
 
-        last_raise = self.pots[last_pot].raised - prev_raise_level
+        last_raise = pot.raised - prev_raise_level
         self.last_raise = max(last_raise, self.last_raise)
 
         # players previously in pot need to call in event of a raise
-        if last_raise > 0:
-            for pot_player_id in self._get_pot(last_pot).players_in_pot():
-                if (
-                    self._get_pot(last_pot).chips_to_call(pot_player_id) > 0
-                    and self.players[pot_player_id].state == PlayerState.IN
-                ):
-                    self.players[pot_player_id].state = PlayerState.TO_CALL
+        min_all_in = self._update_pot_states(pot, last_raise > 0)
 
         # if a player is all_in in this pot, split a new one off
-        if PlayerState.ALL_IN in (
-            self.players[i].state for i in self._get_pot(last_pot).players_in_pot()
-        ):
-            raised_level = min(
-                self._get_pot(last_pot).get_player_amount(i)
-                for i in self._get_pot(last_pot).players_in_pot()
-                if self.players[i].state == PlayerState.ALL_IN
-            )
-            self._split_pot(last_pot, raised_level)
+        if min_all_in is not None:
+            self._split_pot(last_pot, min_all_in)
 
-        self.players[player_id].chips = self.players[player_id].chips - original_amount
+        player.chips = player.chips - original_amount
+        self._player_bets[player_id] += original_amount
+
+    def _update_pot_states(self, pot: Pot, raised: bool) -> Optional[int]:
+        """
+        In one pass over the players in the given pot, set the players that are IN
+        but short of the raised level to TO_CALL (if there was a raise) and find
+        the smallest all-in amount.
+
+        Arguments:
+            pot (Pot): The pot that was just posted to
+            raised (bool): True if the post raised the pot
+
+        Returns:
+            Optional[int]: The smallest amount an all-in player has in the pot,
+                None if no player in the pot is all-in.
+
+        """
+        states, player_amounts = self._player_states, pot.player_amounts
+        in_value, all_in_value = PlayerState.IN.value, PlayerState.ALL_IN.value
+        min_all_in = None
+        for pot_player_id in pot.players_in_pot():
+            state = states[pot_player_id]
+            if state == all_in_value:
+                if min_all_in is None or player_amounts[pot_player_id] < min_all_in:
+                    min_all_in = player_amounts[pot_player_id]
+            elif (
+                raised
+                and state == in_value
+                and player_amounts[pot_player_id] < pot.raised
+            ):
+                self._set_player_state(pot_player_id, PlayerState.TO_CALL)
+        return min_all_in
+
+    def _set_player_state(self, player_id: int, state: PlayerState):
+        """
+        Sets the state of the given player and keeps the player state list and the
+        bitmasks of :obj:`~texasholdem.game.player_state.PlayerState.IN` and
+        :obj:`~texasholdem.game.player_state.PlayerState.TO_CALL` players up to date.
+
+        Arguments:
+            player_id (int): The player id
+            state (PlayerState): The new state of the player
+
+        """
+        # pylint: disable=protected-access
+        bit = 1 << player_id
+        self._in_mask &= ~bit
+        self._to_call_mask &= ~bit
+
+        if state == PlayerState.IN:
+            self._in_mask |= bit
+        elif state == PlayerState.TO_CALL:
+            self._to_call_mask |= bit
+
+        self.players[player_id]._state = state
+        self._player_states[player_id] = state.value
 
     def _get_pot(self, pot_id: int) -> Pot:
         """
@@ -559,17 +727,8 @@ class TexasHoldEm:
             bool: True if no more actions can be taken by the remaining players.
 
         """
-        count = 0
-        for i in self.active_iter():
-            if self.players[i].state == PlayerState.TO_CALL:
-                return False
-
-            if self.players[i].state == PlayerState.IN:
-                count += 1
-
-            if count > 1:
-                return False
-        return True
+        # no one to call and at most one bit set in the IN mask
+        return not self._to_call_mask and not self._in_mask & (self._in_mask - 1)
 
     def _settle(self):
         """
@@ -585,16 +744,17 @@ class TexasHoldEm:
 
         self.current_player = next(self.in_pot_iter(loc=self.btn_loc + 1))
 
+        # a player's hand rank is the same for every side pot they are in
+        hand_ranks = {}
+
         for i, pot in enumerate(self.pots, 0):
             players_in_pot = list(pot.players_in_pot())
+            total_amount = pot.get_total_amount()
+
             # only player left in pot wins
             if len(players_in_pot) == 1:
-                self.players[players_in_pot[0]].chips += pot.get_total_amount()
-                settle_history.pot_winners[i] = (
-                    pot.get_total_amount(),
-                    -1,
-                    players_in_pot,
-                )
+                self.players[players_in_pot[0]].chips += total_amount
+                settle_history.pot_winners[i] = (total_amount, -1, players_in_pot)
                 continue
 
             # make sure there is 5 cards on the board
@@ -603,32 +763,60 @@ class TexasHoldEm:
                 settle_history.new_cards.extend(new_cards)
                 self.board.extend(new_cards)
 
-            player_ranks = {}
-            for player_id in players_in_pot:
-                player_ranks[player_id] = evaluator.evaluate(
-                    self.hands[player_id], self.board
+            # rank the new players together so the work on the board is shared
+            unranked = [
+                player_id for player_id in players_in_pot if player_id not in hand_ranks
+            ]
+            if unranked:
+                ranks = evaluator.evaluate_batch(
+                    [self.hands[player_id] for player_id in unranked],
+                    [self.board] * len(unranked),
                 )
+                hand_ranks.update(zip(unranked, ranks))
 
-            best_rank = min(player_ranks.values())
-            winners = [
-                player_id
-                for player_id, player_rank in player_ranks.items()
-                if player_rank == best_rank
-            ]
+            best_rank, winners = self._pay_pot_winners(
+                players_in_pot, hand_ranks, total_amount
+            )
+            settle_history.pot_winners[i] = (total_amount, best_rank, winners)
+
+    def _pay_pot_winners(
+        self, players_in_pot: List[int], hand_ranks: Dict[int, int], total_amount: int
+    ) -> Tuple[int, List[int]]:
+        """
+        Splits the given pot amount between the players in the pot with the best
+        hand rank.
 
-            settle_history.pot_winners[i] = (pot.get_total_amount(), best_rank, winners)
+        Arguments:
+            players_in_pot (List[int]): The player ids in the pot
+            hand_ranks (Dict[int, int]): The hand rank of each player in the pot
+            total_amount (int): The amount of chips in the pot
+
+        Returns:
+            Tuple[int, List[int]]: The best hand rank and the ids of the players with it
+
+        """
+        # find the best rank and everyone who has it in one pass
+        best_rank, winners = None, []
+        for player_id in players_in_pot:
+            player_rank = hand_ranks[player_id]
+
+            if best_rank is None or player_rank < best_rank:
+                best_rank, winners = player_rank, [player_id]
+            elif player_rank == best_rank:
+                winners.append(player_id)
 
-            win_amount = pot.get_total_amount() // len(winners)
-            for player_id in winners:
-                self.players[player_id].chips += win_amount
+        win_amount, leftover = divmod(total_amount, len(winners))
+        for player_id in winners:
+            self.players[player_id].chips += win_amount
+
+        # leftover chip goes to player left of the button WSOP Rule 73
+        if leftover:
+            for j in self.in_pot_iter(loc=self.btn_loc + 1):
+                if j in winners:
+                    self.players[j].chips += leftover
+                    break
 
-            # leftover chip goes to player left of the button WSOP Rule 73
-            leftover = pot.get_total_amount() - (win_amount * len(winners))
-            if leftover:
-                for j in self.in_pot_iter(loc=self.btn_loc + 1):
-                    if j in winners:
-                        self.players[j].chips += leftover
-                        break
+        return best_rank, winners
 
     def chips_to_call(self, player_id: int) -> int:
         """
@@ -638,10 +826,12 @@ class TexasHoldEm:
             int: The amount of chips the player needs to call in all pots to play the hand.
 
         """
-        return sum(
-            self._get_pot(i).chips_to_call(player_id)
-            for i in range(self.players[player_id].last_pot + 1)
-        )
+        last_pot = self.players[player_id].last_pot
+        if last_pot == 0:
+            return self.pots[0].chips_to_call(player_id)
+
+        pots = self.pots
+        return sum(pots[i].chips_to_call(player_id) for i in range(last_pot + 1))
 
     def player_bet_amount(self, player_id: int) -> int:
         """
@@ -651,9 +841,7 @@ class TexasHoldEm:
             int: The amount of chips the player bet this round across all pots.
 
         """
-        return sum(
-            self._get_pot(i).get_player_amount(player_id) for i in range(len(self.pots))
-        )
+        return self._player_bets[player_id]
 
     def chips_at_stake(self, player_id: int) -> int:
         """
@@ -664,9 +852,9 @@ class TexasHoldEm:
 
         """
         return sum(
-            self._get_pot(i).get_total_amount()
-            for i in range(len(self.pots))
-            if player_id in self._get_pot(i).players_in_pot()
+            pot.get_total_amount()
+            for pot in self.pots
+            if player_id in pot.players_in_pot()
         )
 
     @versionadded(version="0.6.0")
@@ -764,14 +952,6 @@ class TexasHoldEm:
             )
             total = value
 
-        # ALL_IN should be translated
-        new_action, new_total = action, total
-        if new_action == ActionType.ALL_IN:
-            new_action, new_total = self._translate_allin(new_action, new_total)
-
-        player_amount = self.player_bet_amount(player_id)
-        chips_to_call = self.chips_to_call(player_id)
-
         if not action:
             return False, "Action is None."
 
@@ -782,6 +962,11 @@ class TexasHoldEm:
                 f"player (Current player {self.current_player})",
             )
 
+        # ALL_IN should be translated
+        new_action, new_total = action, total
+        if new_action == ActionType.ALL_IN:
+            new_action, new_total = self._translate_allin(new_action, new_total)
+
         if (
             new_action == ActionType.CALL
             and self.players[player_id].state != PlayerState.TO_CALL
@@ -811,14 +996,20 @@ class TexasHoldEm:
                     "Betting round is over at this point, can only CALL or FOLD.",
                 )
 
+            # only a raise needs the bet amounts
+            player_amount = self.player_bet_amount(player_id)
+            chips_to_call = self.chips_to_call(player_id)
+            raise_value = self.total_to_value(new_total, player_id)
+            min_raise = self.min_raise()
+
             if (
-                self.total_to_value(new_total, player_id) < self.min_raise()
+                raise_value < min_raise
                 and new_total < player_amount + self.players[player_id].chips
             ):
                 return (
                     False,
-                    f"Cannot raise {self.total_to_value(new_total, player_id)}, "
-                    f"less than the min raise {self.min_raise()} and player "
+                    f"Cannot raise {raise_value}, "
+                    f"less than the min raise {min_raise} and player "
                     f"{player_id} is not going all-in.",
                 )
             if player_amount + self.players[player_id].chips < new_total:
@@ -883,20 +1074,56 @@ class TexasHoldEm:
         if action == ActionType.ALL_IN:
             action, total = self._translate_allin(action, total=total)
 
-        player_amount = self.player_bet_amount(self.current_player)
-        chips_to_call = self.chips_to_call(self.current_player)
-
         # Execute move
-        if action == ActionType.CALL:
-            self._player_post(self.current_player, chips_to_call)
-        elif action == ActionType.CHECK:
-            pass
-        elif action == ActionType.RAISE:
-            self._player_post(self.current_player, total - player_amount)
-        elif action == ActionType.FOLD:
-            self.players[self.current_player].state = PlayerState.OUT
-            for i in range(self.players[self.current_player].last_pot + 1):
-                self.pots[i].remove_player(self.current_player)
+        self._action_handler[action](total)
+
+    def _call(self, total: Optional[int] = None):
+        # pylint: disable=unused-argument
+        """
+        The current player calls.
+
+        """
+        self._player_post(self.current_player, self.chips_to_call(self.current_player))
+
+    def _check(self, total: Optional[int] = None):
+        # pylint: disable=unused-argument
+        """
+        The current player checks.
+
+        """
+
+    def _raise(self, total: Optional[int] = None):
+        """
+        The current player raises.
+
+        Arguments:
+            total (int, optional): How much to raise *to*
+
+        """
+        self._player_post(
+            self.current_player,
+            total - self.player_bet_amount(self.current_player),
+        )
+
+    def _fold(self, total: Optional[int] = None):
+        # pylint: disable=unused-argument
+        """
+        The current player folds and is removed from every pot they are in.
+
+        """
+        player_id = self.current_player
+        self._set_player_state(player_id, PlayerState.OUT)
+
+        # no side pots, the player only needs to be removed from the main pot
+        last_pot = self.players[player_id].last_pot
+        if last_pot == 0:
+            self.pots[0].remove_player(player_id)
+            self._player_bets[player_id] = 0
+            return
+
+        for i in range(last_pot + 1):
+            self._player_bets[player_id] -= self.pots[i].get_player_amount(player_id)
+            self.pots[i].remove_player(player_id)
 
     def _translate_allin(
         self, action: ActionType, total: int = None
@@ -929,13 +1156,15 @@ class TexasHoldEm:
         """
         raised_sum = 0
 
-        for action in reversed(self.hand_history[self.hand_phase].actions):
-            if (
-                self.players[action.player_id].state == PlayerState.ALL_IN
-                and action.action_type == ActionType.RAISE
-            ):
+        actions = self.hand_history[self.hand_phase].actions
+        states = self._player_states
+        all_in_value, in_value = PlayerState.ALL_IN.value, PlayerState.IN.value
+        for i in range(len(actions) - 1, -1, -1):
+            action = actions[i]
+            state = states[action.player_id]
+            if state == all_in_value and action.action_type == ActionType.RAISE:
                 raised_sum += action.value
-            elif self.players[action.player_id].state == PlayerState.IN:
+            elif state == in_value:
                 break
 
         return raised_sum
@@ -969,13 +1198,11 @@ class TexasHoldEm:
 
         # add new cards to the board
         new_cards = self._deck.draw(num=hand_phase.new_cards())
-        self.hand_history[hand_phase] = BettingRoundHistory(
-            new_cards=new_cards, actions=[]
-        )
+        betting_history = BettingRoundHistory(new_cards=new_cards, actions=[])
+        self.hand_history[hand_phase] = betting_history
         self.board.extend(new_cards)
 
         # reset last raise
-        first_pot = self._last_pot_id()
         self.last_raise = 0
         self.raise_option = True
 
@@ -991,10 +1218,11 @@ class TexasHoldEm:
             # if no more active players that can raise continue with the players to call
             # while disabling the raise availability.
             if not player_queue:
+                to_call_mask = self._to_call_mask
                 player_queue = deque(
-                    self.player_iter(
-                        loc=self.current_player + 1, match_states=(PlayerState.TO_CALL,)
-                    )
+                    player_id
+                    for player_id in self._seats(self.current_player + 1, False)
+                    if to_call_mask >> player_id & 1
                 )
                 if not player_queue:
                     break
@@ -1008,11 +1236,10 @@ class TexasHoldEm:
             self.current_player = player_queue.popleft()
             yield self
 
+            # take_action already validated this move against the current state
             action, total = self._translate_allin(*self._action)
             value = self.total_to_value(total=total, player_id=self.current_player)
-            self.validate_move(action=action, total=total, throws=True)
 
-            betting_history = self.hand_history[self.hand_phase]
             betting_history.actions.append(
                 PlayerAction(
                     player_id=self.current_player,
@@ -1038,16 +1265,18 @@ class TexasHoldEm:
                     self.last_raise = raise_sum
 
                 # reset the round (i.e. as if the betting round started here)
-                player_queue = deque(self.active_iter(self.current_player))
+                # starting with the player after the raiser
+                player_queue = deque(self.active_iter(self.current_player + 1))
 
-                # Throwaway current player
-                # Edge case: active_iter already excludes ALL_IN
-                if self.players[self.current_player].state != PlayerState.ALL_IN:
-                    player_queue.popleft()
+                # Throwaway current player, who comes last unless they are ALL_IN
+                if player_queue and player_queue[-1] == self.current_player:
+                    player_queue.pop()
 
-        # consolidate betting to all pots in this betting round
-        for i in range(first_pot, len(self.pots)):
-            self._get_pot(i).collect_bets()
+        # consolidate betting to all pots, this includes pots split off
+        # while posting the blinds before the preflop round started
+        for pot in self.pots:
+            pot.collect_bets()
+        self._player_bets = [0] * self.max_players
 
     def get_hand(self, player_id) -> List[Card]:
         """
@@ -1073,7 +1302,7 @@ class TexasHoldEm:
             raise ValueError("In the middle of a hand!")
 
         self.hand_phase = HandPhase.PREHAND
-        self._handstate_handler[self.hand_phase]()
+        self._prehand()
 
         if self.game_state == GameState.STOPPED:
             return
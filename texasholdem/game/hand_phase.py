@@ -71,7 +71,7 @@ class HandPhase(Enum):
             HandPhase: The next HandPhase after this one
 
         """
-        return HandPhase[self.value.next_phase]
+        return _NEXT_PHASE[self]
 
     def new_cards(self) -> int:
         """
@@ -79,4 +79,10 @@ class HandPhase(Enum):
             int: The number of new cards to add to the board
 
         """
-        return self.value.new_cards
+        return _NEW_CARDS[self]
+
+
+# the phase after each phase and the number of new cards in each phase,
+# resolved once since next_phase and new_cards are called on every phase change
+_NEXT_PHASE = {phase: HandPhase[phase.value.next_phase] for phase in HandPhase}
+_NEW_CARDS = {phase: phase.value.new_cards for phase in HandPhase}
@@ -10,13 +10,17 @@ Texas Hold Em Notation Conventions:
 
 """
 from __future__ import annotations
-from typing import Optional, Union, Tuple, List, Dict
+from typing import Optional, Union, Tuple, List, Dict, TextIO
+from collections import defaultdict
+from itertools import chain
 from dataclasses import dataclass
 from pathlib import Path
+import io
 import os
+import re
 
 from texasholdem.game.action_type import ActionType
-from texasholdem.card.card import Card
+from texasholdem.card.card import Card, card_strings_to_int
 from texasholdem.game.hand_phase import HandPhase
 from texasholdem.evaluator import evaluator
 
@@ -27,6 +31,18 @@ The extension for the game notation file.
 
 """
 
+# (Pot pot_id,amount,best_rank,[winner, ...])
+_POT_WINNERS_RE = re.compile(
+    r"\(\s*Pot\s*(\d+)\s*,\s*(\d+)\s*,\s*(-?\d+)\s*,\s*\[([\d,\s]+)\]\s*\)"
+)
+
+# plain dict lookups for the enum names found in a PGN
+_ACTION_BY_NAME = {action_type.name: action_type for action_type in ActionType}
+_PHASE_BY_NAME = {hand_phase.name: hand_phase for hand_phase in HandPhase}
+
+# the History attribute holding each phase
+_PHASE_ATTRS = {hand_phase: hand_phase.name.lower() for hand_phase in HandPhase}
+
 
 class HistoryImportError(Exception):
     """
@@ -35,6 +51,40 @@ class HistoryImportError(Exception):
     """
 
 
+def _after(string: str, sep: str) -> str:
+    """
+    Arguments:
+        string (str): A line of the form :code:`{label}{sep}{data}`
+        sep (str): The separator after the label
+    Returns:
+        str: The data after the separator
+    Raises:
+        ValueError: If the separator is missing
+
+    """
+    return string[string.index(sep) + len(sep) :]
+
+
+def _card_list(string: str) -> List[Card]:
+    """
+    Arguments:
+        string (str): A line of the form :code:`{label}: [{card},{card},...]`
+    Returns:
+        List[Card]: The cards between the brackets
+    Raises:
+        ValueError: If the brackets are missing or the cards are invalid
+
+    """
+    start, end = string.index("["), string.index("]")
+    if end < start:
+        raise ValueError(f"Expected a list of cards, got '{string}'")
+
+    cards_str = string[start + 1 : end]
+    if not cards_str:
+        return []
+    return card_strings_to_int(cards_str.split(","))
+
+
 @dataclass()
 class PrehandHistory:
     """
@@ -42,6 +92,8 @@ class PrehandHistory:
 
     """
 
+    __slots__ = ("btn_loc", "big_blind", "small_blind", "player_chips", "player_cards")
+
     btn_loc: int
     """
     The id of the player with the button
@@ -71,16 +123,15 @@ class PrehandHistory:
             str: The string representation of the prehand history: blind sizes, chips, and cards
 
         """
-        str_player_cards = {
-            i: [str(card) for card in self.player_cards[i]] for i in canon_ids
-        }
+        player_cards = ",".join(
+            [f"[{' '.join(map(str, self.player_cards[i]))}]" for i in canon_ids]
+        )
 
         return (
             f"Big Blind: {self.big_blind}\n"
             f"Small Blind: {self.small_blind}\n"
-            f"Player Chips: {','.join(str(self.player_chips[i]) for i in canon_ids)}\n"
-            f"Player Cards: "
-            f"{','.join(['[' + ' '.join(str_player_cards[i]) + ']' for i in canon_ids])}"
+            f"Player Chips: {','.join([str(self.player_chips[i]) for i in canon_ids])}\n"
+            f"Player Cards: {player_cards}"
         )
 
     @staticmethod
@@ -97,17 +148,16 @@ class PrehandHistory:
 
         """
         big_blind, small_blind, chips_str, cards_str = string.split("\n")
-        _, big_blind = big_blind.split(": ")
-        _, small_blind = small_blind.split(": ")
+        big_blind = _after(big_blind, ": ")
+        small_blind = _after(small_blind, ": ")
 
-        _, chips_str = chips_str.split(": ")
+        chips_str = _after(chips_str, ": ")
         player_chips = [int(chip_str) for chip_str in chips_str.split(",")]
-        num_players = len(player_chips)
 
-        _, cards_str = cards_str.split(": ")
+        cards_str = _after(cards_str, ": ")
         cards_data = cards_str.split(",")
         cards_data = [card_data.strip("[]").split(" ") for card_data in cards_data]
-        player_cards = [[Card(c1), Card(c2)] for c1, c2 in cards_data]
+        player_cards = [card_strings_to_int((c1, c2)) for c1, c2 in cards_data]
 
         if len(player_chips) != len(player_cards):
             raise HistoryImportError(
@@ -119,8 +169,8 @@ class PrehandHistory:
             0,
             int(big_blind),
             int(small_blind),
-            dict(zip(range(num_players), player_chips)),
-            dict(zip(range(num_players), player_cards)),
+            dict(enumerate(player_chips)),
+            dict(enumerate(player_cards)),
         )
 
 
@@ -155,12 +205,10 @@ class PlayerAction:
         Returns:
             str: The string representation of a player action: id, action, amount
         """
-        string = f"({canon_ids[self.player_id]},{self.action_type.name}"
-        if self.total is not None and self.total > 0:
-            string += "," + str(self.total)
-        string += ")"
-
-        return string
+        total = self.total
+        if total is not None and total > 0:
+            return f"({canon_ids[self.player_id]},{self.action_type.name},{total})"
+        return f"({canon_ids[self.player_id]},{self.action_type.name})"
 
     @staticmethod
     def from_string(string: str) -> PlayerAction:
@@ -174,7 +222,7 @@ class PlayerAction:
         """
         string = string.strip().strip("()")
         data = string.split(",")
-        player_id, action_type = int(data[0]), ActionType[data[1]]
+        player_id, action_type = int(data[0]), _ACTION_BY_NAME[data[1]]
         total = None if len(data) <= 2 else int(data[2])
         return PlayerAction(player_id=player_id, action_type=action_type, total=total)
 
@@ -192,6 +240,8 @@ class BettingRoundHistory:
 
     """
 
+    __slots__ = ("new_cards", "actions")
+
     new_cards: List[Card]
     """
     The new cards that were added this round
@@ -209,16 +259,17 @@ class BettingRoundHistory:
             str: The string representation of the betting round history:
                 new cards revealed, ordered list of actions
         """
-        new_cards = f"New Cards: [{','.join(str(card) for card in self.new_cards)}]"
-        counts = {}
-        orbits = {}
+        new_cards = f"New Cards: [{','.join([str(card) for card in self.new_cards])}]"
+        counts = defaultdict(int)
+        orbits = defaultdict(list)
 
+        # only one count goes up per action, so the max can be kept as we go
+        min_count = 0
         for action in self.actions:
-            counts[action.player_id] = counts.get(action.player_id, 0) + 1
-            min_count = max(counts.values())
+            counts[action.player_id] += 1
+            if counts[action.player_id] > min_count:
+                min_count = counts[action.player_id]
 
-            if min_count not in orbits:
-                orbits[min_count] = []
             orbits[min_count].append(action.to_string(canon_ids))
 
         orbit_lines = [
@@ -238,24 +289,14 @@ class BettingRoundHistory:
         Returns:
             BettingRoundHistory: The betting round as represented by the string
         """
-        data = string.split("\n")
-        card_str, data = data[0], data[1:]
-        _, card_str = card_str.split("[")
-        card_str, _ = card_str.split("]")
-
-        if card_str:
-            new_cards = [Card(string) for string in card_str.split(",")]
-        else:
-            new_cards = []
+        card_str, *action_lines = string.split("\n")
+        new_cards = _card_list(card_str)
 
-        action_str = ""
-        for i, action_line in enumerate(data, 1):
-            _, action_line = action_line.split(". ")
-            action_str += action_line
-            if i != len(data):
-                action_str += ";"
-
-        actions = [PlayerAction.from_string(string) for string in action_str.split(";")]
+        actions = [
+            PlayerAction.from_string(action_str)
+            for action_line in action_lines
+            for action_str in _after(action_line, ". ").split(";")
+        ]
 
         return BettingRoundHistory(new_cards, actions)
 
@@ -267,6 +308,8 @@ class SettleHistory:
 
     """
 
+    __slots__ = ("new_cards", "pot_winners")
+
     new_cards: List[Card]
     """
     The new cards that were added this round
@@ -284,22 +327,13 @@ class SettleHistory:
             str: The string representation of the settle history: new cards revealed,
                 and the winners per pot: (pot_id, total_amount, best_rank, winners list)
         """
-        pot_lists = []
-        for pot_id, (amount, best_rank, winners_list) in self.pot_winners.items():
-            pot_lists.append(
-                (
-                    pot_id,
-                    amount,
-                    best_rank,
-                    [canon_ids[winner] for winner in winners_list],
-                )
-            )
         pot_strs = [
-            f"(Pot {pot_id},{amount},{best_rank},{str(winners_list)})"
-            for pot_id, amount, best_rank, winners_list in pot_lists
+            f"(Pot {pot_id},{amount},{best_rank},"
+            f"[{', '.join([str(canon_ids[winner]) for winner in winners_list])}])"
+            for pot_id, (amount, best_rank, winners_list) in self.pot_winners.items()
         ]
         return (
-            f"New Cards: [{','.join(str(card) for card in self.new_cards)}]\n"
+            f"New Cards: [{','.join([str(card) for card in self.new_cards])}]\n"
             f"Winners: {';'.join(pot_strs)}"
         )
 
@@ -314,34 +348,20 @@ class SettleHistory:
             SettleHistory: The settle history as represented by the string
         """
         cards_str, winners_str = string.split("\n")
-        _, cards_str = cards_str.split("[")
-        cards_str, _ = cards_str.split("]")
-
-        if cards_str:
-            new_cards = [Card(string) for string in cards_str.split(",")]
-        else:
-            new_cards = []
-
-        _, winners_str = winners_str.split(": ")
-        pot_winners_data = [
-            winner_str.strip("()")
-            .replace(" ", "")
-            .replace("[", "")
-            .replace("]", "")
-            .split(",")
-            for winner_str in winners_str.split(";")
-        ]
-        pot_winners_data = [
-            (data[0], data[1], data[2], data[3:]) for data in pot_winners_data
-        ]
-        pot_winners = {
-            int(pot_name[(pot_name.find("Pot") + 3) :]): (
+        new_cards = _card_list(cards_str)
+
+        pot_winners = {}
+        for winner_str in _after(winners_str, ": ").split(";"):
+            match = _POT_WINNERS_RE.fullmatch(winner_str.strip())
+            if match is None:
+                raise ValueError(f"Invalid pot winners '{winner_str}'")
+
+            pot_id, amount, best_rank, winners_list = match.groups()
+            pot_winners[int(pot_id)] = (
                 int(amount),
                 int(best_rank),
-                [int(winner) for winner in winners_list],
+                [int(winner) for winner in winners_list.split(",")],
             )
-            for pot_name, amount, best_rank, winners_list in pot_winners_data
-        }
         return SettleHistory(new_cards, pot_winners)
 
     def __str__(self) -> str:
@@ -363,6 +383,16 @@ class SettleHistory:
         return "\n".join(pot_lists)
 
 
+_HISTORY_ITEM_TYPES = {
+    HandPhase.PREHAND: PrehandHistory,
+    HandPhase.PREFLOP: BettingRoundHistory,
+    HandPhase.FLOP: BettingRoundHistory,
+    HandPhase.TURN: BettingRoundHistory,
+    HandPhase.RIVER: BettingRoundHistory,
+    HandPhase.SETTLE: SettleHistory,
+}
+
+
 @dataclass()
 class History:
     """
@@ -410,16 +440,26 @@ class History:
             str: The string representation of the hand history.
 
         """
-        num_players = len(self.prehand.player_chips)
+        buffer = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
+
+    def write(self, file: TextIO):
+        """
+        Writes the string representation of the hand history (as in :meth:`to_string()`)
+        to the given text file one section at a time.
+
+        Arguments:
+            file (TextIO): The text file to write to
+
+        """
+        btn_loc, player_chips = self.prehand.btn_loc, self.prehand.player_chips
+        seats = range(len(player_chips))
         old_ids = [
-            i % num_players
-            for i in range(self.prehand.btn_loc, self.prehand.btn_loc + num_players)
-            if self.prehand.player_chips[i % num_players] > 0
+            i for i in (*seats[btn_loc:], *seats[:btn_loc]) if player_chips[i] > 0
         ]
         canon_ids = dict(zip(old_ids, range(len(old_ids))))
 
-        string = ""
-
         for history_item, name in [
             (self.prehand, HandPhase.PREHAND.name),
             (self.preflop, HandPhase.PREFLOP.name),
@@ -429,10 +469,9 @@ class History:
             (self.settle, HandPhase.SETTLE.name),
         ]:
             if history_item is not None:
-                string += f"{name.upper()}\n" + history_item.to_string(canon_ids)
-                string += "\n" if name == HandPhase.SETTLE.name else "\n\n"
-
-        return string
+                file.write(f"{name.upper()}\n")
+                file.write(history_item.to_string(canon_ids))
+                file.write("\n" if name == HandPhase.SETTLE.name else "\n\n")
 
     @staticmethod
     def _strip_comments(string: str) -> str:
@@ -443,6 +482,9 @@ class History:
             str: The history string without comments.
 
         """
+        if "#" not in string:
+            return string
+
         new_lines = []
         for line in string.split("\n"):
             comment_index = line.find("#")
@@ -473,23 +515,14 @@ class History:
         for section in sections:
             newline = section.find("\n")
             header, rest = section[:newline], section[(newline + 1) :]
-            if header == HandPhase.PREHAND.name:
-                history_item = PrehandHistory
-            elif header in (
-                HandPhase.PREFLOP.name,
-                HandPhase.FLOP.name,
-                HandPhase.TURN.name,
-                HandPhase.RIVER.name,
-            ):
-                history_item = BettingRoundHistory
-            elif header == HandPhase.SETTLE.name:
-                # remove trailing newline for end of line
-                history_item, rest = SettleHistory, rest[:-1]
-            else:
+            hand_phase = _PHASE_BY_NAME.get(header)
+            if hand_phase is None:
                 raise HistoryImportError(f"Unexpected header in history: '{header}'")
+            if hand_phase == HandPhase.SETTLE:
+                # remove trailing newline for end of line
+                rest = rest[:-1]
 
-            history_item = history_item.from_string(rest)
-            history[HandPhase[header]] = history_item
+            history[hand_phase] = _HISTORY_ITEM_TYPES[hand_phase].from_string(rest)
 
         return history
 
@@ -518,17 +551,16 @@ class History:
         if f".{FILE_EXTENSION}" not in hist_path.suffixes:
             hist_path = hist_path.parent / f"{hist_path.name}.{FILE_EXTENSION}"
 
-        # resolve lowest file_num
-        original_path = hist_path
-        num = 1
-        while hist_path.exists():
-            hist_path = (
-                original_path.parent / f"{original_path.stem}({num}).{FILE_EXTENSION}"
-            )
-            num += 1
+        # resolve lowest file_num from one listing of the directory
+        if hist_path.exists():
+            existing = set(os.listdir(hist_path.parent))
+            num = 1
+            while f"{hist_path.stem}({num}).{FILE_EXTENSION}" in existing:
+                num += 1
+            hist_path = hist_path.parent / f"{hist_path.stem}({num}).{FILE_EXTENSION}"
 
         with open(hist_path, mode="w+", encoding="ascii") as file:
-            file.write(self.to_string())
+            self.write(file)
 
         return hist_path.absolute().resolve()
 
@@ -560,8 +592,7 @@ class History:
 
         # run checks
         history._check_missing_sections()
-        history._check_unique_cards()
-        history._check_correct_board_len()
+        history._check_cards()
 
         if len(history.prehand.player_chips) <= 1:
             raise HistoryImportError(
@@ -589,32 +620,16 @@ class History:
                     f"but not a section for {hand_phase.name}"
                 )
 
-    def _check_unique_cards(self):
+    def _check_cards(self):
         """
-        Raises:
-            HistoryImportError: If the cards in the history are not unique
-
-        """
-        cards = sum(self.prehand.player_cards.values(), [])
-        for hand_phase in (
-            HandPhase.PREFLOP,
-            HandPhase.FLOP,
-            HandPhase.TURN,
-            HandPhase.RIVER,
-        ):
-            history_item = self[hand_phase]
-            if history_item:
-                cards += history_item.new_cards
+        Checks the unique cards and the board length in one pass over the streets.
 
-        if len(cards) != len(set(cards)):
-            raise HistoryImportError("Expected cards given in history to be unique.")
-
-    def _check_correct_board_len(self):
-        """
         Raises:
-            HistoryImportError: If the cards do not come out in the proper amount
+            HistoryImportError: If the cards in the history are not unique or
+                if the cards do not come out in the proper amount
 
         """
+        cards = list(chain.from_iterable(self.prehand.player_cards.values()))
         total_board_len = 0
         for hand_phase in (
             HandPhase.PREFLOP,
@@ -629,8 +644,12 @@ class History:
                         f"Expected {hand_phase.new_cards()} "
                         f"new cards in phase {hand_phase.name}"
                     )
+                cards += history_item.new_cards
                 total_board_len += len(history_item.new_cards)
 
+        if len(cards) != len(set(cards)):
+            raise HistoryImportError("Expected cards given in history to be unique.")
+
         # settle
         for _, (_, rank, _) in self.settle.pot_winners.items():
             if rank != -1:
@@ -645,12 +664,12 @@ class History:
         hand_phase: HandPhase,
         history: Union[PrehandHistory, BettingRoundHistory, SettleHistory],
     ) -> None:
-        setattr(self, hand_phase.name.lower(), history)
+        setattr(self, _PHASE_ATTRS[hand_phase], history)
 
     def __getitem__(
         self, hand_phase: HandPhase
     ) -> Union[PrehandHistory, BettingRoundHistory, SettleHistory]:
-        return getattr(self, hand_phase.name.lower())
+        return getattr(self, _PHASE_ATTRS[hand_phase])
 
     def __contains__(self, hand_phase: HandPhase) -> bool:
         if self.__getitem__(hand_phase):
@@ -10,6 +10,9 @@ from deprecated.sphinx import versionadded
 
 from texasholdem.game.action_type import ActionType
 
+# position of each action type in the enum, used to order the moves
+_ACTION_ORDER = {action_type: i for i, action_type in enumerate(ActionType)}
+
 
 @versionadded(version="0.9.0")
 class MoveIterator(Sequence):
@@ -26,8 +29,18 @@ class MoveIterator(Sequence):
             self._raise_range = moves[ActionType.RAISE]
 
         self._action_types = list(
-            sorted(moves.keys(), key=tuple(ActionType).index, reverse=True)
+            sorted(moves.keys(), key=_ACTION_ORDER.__getitem__, reverse=True)
         )
+        self._update_len()
+
+    def _update_len(self):
+        """
+        Caches the lengths used by :meth:`__len__` and :meth:`__getitem__`, call
+        whenever the action types or raise range change.
+
+        """
+        self._num_action_types = len(self._action_types)
+        self._len = self._num_action_types + len(self._raise_range) - 1
 
     def __contains__(self, item) -> bool:
         if isinstance(item, ActionType):
@@ -49,25 +62,27 @@ class MoveIterator(Sequence):
         return False
 
     def __len__(self) -> int:
-        return len(self._action_types) + len(self._raise_range) - 1
+        return self._len
 
     def __getitem__(self, item: int) -> ActionType:
-        if item < len(self._action_types) - 1:
+        if item < self._num_action_types - 1:
             return self._action_types[item], None
         if not self._raise_range:
             raise IndexError
-        if item < len(self):
-            return ActionType.RAISE, self._raise_range[item - len(self._action_types)]
+        if item < self._len:
+            return ActionType.RAISE, self._raise_range[item - self._num_action_types]
         raise IndexError
 
     def __delitem__(self, key) -> None:
         if isinstance(key, ActionType):
             if key in self._action_types:
                 self._action_types.__delitem__(key)
+                self._update_len()
             elif key == ActionType.RAISE:
                 if key not in self._raise_range:
                     raise KeyError
                 self._raise_range = range(0)
+                self._update_len()
         raise KeyError
 
     def __repr__(self) -> str:
@@ -83,9 +98,9 @@ class MoveIterator(Sequence):
     def action_types(self) -> List[ActionType]:
         """
         Returns:
-            List[ActionType]: A list of action types represented
+            List[ActionType]: A copy of the list of action types represented
         """
-        return self._action_types
+        return list(self._action_types)
 
     @property
     def raise_range(self) -> range:
@@ -109,17 +124,16 @@ class MoveIterator(Sequence):
             Union[Tuple[ActionType, Optional[int]], List[Tuple[ActionType, Optional[int]]]]:
                 The sample(s) of action, total tuples
         """
-        action_types = random.choices(self.action_types, k=num)
-        if ActionType.RAISE in self:
-            totals = random.choices(self.raise_range, k=num)
-            totals = [
-                totals[i] if action_types[i] == ActionType.RAISE else None
-                for i in range(num)
+        action_types = random.choices(self._action_types, k=num)
+        if ActionType.RAISE in self._action_types:
+            totals = random.choices(self._raise_range, k=num)
+            samples = [
+                (action_type, total if action_type == ActionType.RAISE else None)
+                for action_type, total in zip(action_types, totals)
             ]
         else:
-            totals = [None for _ in range(num)]
+            samples = list(zip(action_types, [None] * num))
 
-        samples = list(zip(action_types, totals))
         if num == 1:
             return samples[0]
         return samples